@@ -1,38 +1,7 @@
 #!/bin/bash
 
-# 项目名称
-project="projects_tools"
-
-ROOT_DIR=$(pwd)
-
-# 使用Python一行命令提取版本号，减少对grep和cut的依赖
-version=$(python -c "with open('src/projects_tools/version.py') as f: print([line.split('=')[1].strip().strip('\"') for line in f if '__version__' in line][0])")
-echo "Build ${project} ${version}"
-
-# 清理dist目录
-echo "Clean dist"
-rm -rf ./dist/*
-
-# 卸载当前安装的项目版本
-echo "Uninstall ${project}"
-pip uninstall -y ${project}
-
-# 构建项目
-echo "Build ${project} ${version}"
-python setup.py sdist bdist_wheel
-cd ./dist/
-
-# 安装新构建的项目版本
-echo "Install ${project} ${version}"
-pip install ${project}-${version}-py3-none-any.whl && cd -
-
-# 默认模式设定
+# 构建并安装 projects_tools，MODE=release 时额外打 tag 并上传
+# wheel 构建带缓存，输入未变化时会直接跳过；这里直接使用源码中的 projects 命令
 export MODE=${MODE:-"release"}
 
-# 发布模式下的操作
-if [[ ${MODE} == "release" ]]; then
- git tag v${version}
- git push origin v${version}
- echo "Upload ${project} ${version}"
- twine upload dist/*
-fi
\ No newline at end of file
+PYTHONPATH=src exec python -m projects_tools.commands release --package projects_tools --frontend-dir frontend "$@"
\ No newline at end of file
@@ -14,6 +14,9 @@ from .components import (
     ProxyComponent
 )
 from .electron_python import ElectronPythonApp
+from .project_lock import LOCK_FILE_NAME, update_project
+from .static_builder import StaticBuilder
+from .release import ReleasePipeline, find_package
 
 @click.group()
 def cli():
@@ -76,7 +79,73 @@ def create(project_name, backend, frontend, frontend_type, enable_proxy):
 @click.option("--debug-mode", is_flag=True, help="启用调试模式")
 @click.option("--author-name", default=None, help="项目作者姓名")
 @click.option("--author-email", default=None, help="项目作者邮箱")
-def electron_python(project_name, output_dir, debug_mode, author_name, author_email):
+@click.option("--enable-jobs", is_flag=True, help="生成后台进程池任务子系统，用于CPU密集型引擎函数")
+def electron_python(project_name, output_dir, debug_mode, author_name, author_email, enable_jobs):
     """创建一个新的Electron+Python项目"""
     app = ElectronPythonApp()
-    app.create_project(project_name, output_dir, debug_mode, author_name, author_email)
+    app.create_project(project_name, output_dir, debug_mode, author_name, author_email, enable_jobs)
+
+
+@cli.command(help="根据最新模板增量更新已有项目")
+@click.argument("project_dir", default=".")
+@click.option("--dry-run", is_flag=True, help="只显示将要更新的文件，不写入")
+@click.option("--force", is_flag=True, help="覆盖用户修改过或已删除的文件")
+def update(project_dir, dry_run, force):
+    """Re-render generated files whose template output changed"""
+    if not os.path.exists(os.path.join(project_dir, LOCK_FILE_NAME)):
+        console.print(f"[error]✘ 未找到 {LOCK_FILE_NAME}，该项目不是由 projects 创建或创建时版本过旧", style="error")
+        return
+
+    print_section("增量更新项目")
+    result = update_project(project_dir, dry_run=dry_run, force=force)
+
+    for path in result.updated:
+        console.print(f"[success]{'将更新' if dry_run else '已更新'}[/] {path}")
+    for path in result.modified:
+        console.print(f"[warning]跳过（已被用户修改）[/] {path}")
+    for path in result.missing:
+        console.print(f"[warning]跳过（文件已删除）[/] {path}")
+    for path, error in result.failed.items():
+        console.print(f"[error]渲染失败[/] {path}: {error}")
+
+    console.print(
+        f"[info]更新 {len(result.updated)} 个，未变化 {len(result.unchanged)} 个，"
+        f"跳过 {len(result.modified) + len(result.missing)} 个[/]"
+    )
+    if result.modified or result.missing:
+        console.print("[info]使用 --force 可以覆盖这些文件[/]")
+
+
+@cli.command(name="build-static", help="增量构建前端并同步静态资源到Python包")
+@click.option("--frontend-dir", default="frontend", help="前端项目目录，默认为 frontend")
+@click.option("--web-dir", required=True, help="静态资源目标目录，例如 src/<package>/web")
+@click.option("--force", is_flag=True, help="忽略缓存，强制执行 npm install 和 npm run build")
+def build_static(frontend_dir, web_dir, force):
+    """Build the frontend and sync changed assets into the package"""
+    builder = StaticBuilder(frontend_dir, web_dir, force=force)
+    if not builder.run():
+        raise SystemExit(1)
+
+
+@cli.command(help="增量构建、安装并发布项目（替代 deploy.sh）")
+@click.option("--package", "package_name", default=None, help="src/ 下的Python包名，默认自动检测")
+@click.option("--frontend-dir", default="frontend", help="前端项目目录，默认为 frontend，不存在时跳过")
+@click.option("--mode", envvar="MODE", default="release", show_default=True,
+              help="release 模式下会打 git tag 并上传到 PyPI，可通过 MODE 环境变量设置")
+@click.option("--force", is_flag=True, help="忽略缓存，强制重新构建")
+@click.option("--editable", is_flag=True, help="以可编辑模式 (pip install -e .) 安装，而不是安装构建出的 wheel")
+def release(package_name, frontend_dir, mode, force, editable):
+    """Build, install and publish the project in the current directory"""
+    package_name = package_name or find_package(".")
+    if not package_name:
+        console.print("[error]✘ 无法确定 src/ 下的Python包，请使用 --package 指定", style="error")
+        raise SystemExit(1)
+
+    pipeline = ReleasePipeline(".", package_name, frontend_dir, mode=mode, force=force,
+                               editable=editable)
+    if not pipeline.run():
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    cli()
@@ -229,7 +229,7 @@ class CommonFilesComponent(ProjectComponent):
             # Create .gitignore
             task_id = progress.add_task("Creating .gitignore...", total=None)
             with open(self.project_path / ".gitignore", "w") as f:
-                f.write("web/\nlogs/\n__pycache__/\ndist/\nbuild/\npasted/\n")
+                f.write("web/\nlogs/\n__pycache__/\ndist/\nbuild/\npasted/\n.projects-build.json\n")
             progress.update(task_id, completed=True)
             
             # Create README.md
@@ -11,6 +11,8 @@ import random
 from pathlib import Path
 from jinja2 import Environment, FileSystemLoader
 
+from .project_lock import ProjectLock
+
 class ElectronPythonApp:
     """处理Electron+Python项目的创建和管理"""
     
@@ -20,7 +22,8 @@ class ElectronPythonApp:
         # 创建Jinja2环境
         self.env = Environment(loader=FileSystemLoader(self.templates_dir))
     
-    def create_project(self, project_name, output_dir=None, debug_mode=False, author_name=None, author_email=None):
+    def create_project(self, project_name, output_dir=None, debug_mode=False, author_name=None, author_email=None,
+                       enable_jobs=False):
         """创建一个新的Electron+Python项目
         
         Args:
@@ -29,6 +32,7 @@ class ElectronPythonApp:
             debug_mode: 是否启用调试模式，默认为 False
             author_name: 作者姓名，默认为 "Your Name"
             author_email: 作者邮箱，默认为 "your.email@example.com"
+            enable_jobs: 是否生成后台进程池任务子系统，默认为 False
         """
         if output_dir is None:
             output_dir = os.getcwd()
@@ -52,11 +56,14 @@ class ElectronPythonApp:
             'python_port': 5000,  # 默认端口
             'debug_console': debug_mode,  # 是否显示控制台
             'author_name': author_name or "Your Name",
-            'author_email': author_email or "your.email@example.com"
+            'author_email': author_email or "your.email@example.com",
+            'enable_jobs': enable_jobs  # 是否生成后台任务子系统
         }
         
-        # 渲染并写入模板文件
-        self._render_templates(project_dir, template_vars)
+        # 渲染并写入模板文件，同时记录到锁文件中供 projects update 使用
+        lock = ProjectLock(project_dir, 'electron_python', template_vars)
+        self._render_templates(project_dir, template_vars, lock)
+        lock.save()
         
         print(f"✅ 成功创建项目: {project_name}")
         print(f"项目位置: {project_dir}")
@@ -71,35 +78,41 @@ class ElectronPythonApp:
         
         if debug_mode:
             print("\n已启用调试模式，打包后的Python应用将显示控制台窗口，方便查看错误信息。")
+
+        if enable_jobs:
+            print("\n已启用后台任务子系统，使用 @engine_job 装饰器注册 CPU 密集型函数，它们将在进程池中运行。")
         
         return True
     
-    def _render_templates(self, project_dir, template_vars):
+    def _render_templates(self, project_dir, template_vars, lock=None):
         """渲染模板文件并写入项目目录"""
         # 主项目目录文件
-        self._render_template('package.json.jinja2', os.path.join(project_dir, 'package.json'), template_vars)
-        self._render_template('main.js.jinja2', os.path.join(project_dir, 'main.js'), template_vars)
-        self._render_template('preload.js.jinja2', os.path.join(project_dir, 'preload.js'), template_vars)
-        self._render_template('README.md.jinja2', os.path.join(project_dir, 'README.md'), template_vars)
-        self._render_template('gitignore.jinja2', os.path.join(project_dir, '.gitignore'), template_vars)
+        self._render_template('package.json.jinja2', os.path.join(project_dir, 'package.json'), template_vars, lock)
+        self._render_template('main.js.jinja2', os.path.join(project_dir, 'main.js'), template_vars, lock)
+        self._render_template('preload.js.jinja2', os.path.join(project_dir, 'preload.js'), template_vars, lock)
+        self._render_template('README.md.jinja2', os.path.join(project_dir, 'README.md'), template_vars, lock)
+        self._render_template('gitignore.jinja2', os.path.join(project_dir, '.gitignore'), template_vars, lock)
         
         # 渲染器文件
-        self._render_template('index.html.jinja2', os.path.join(project_dir, 'renderer', 'index.html'), template_vars)
-        self._render_template('index.js.jinja2', os.path.join(project_dir, 'renderer', 'index.js'), template_vars)
-        self._render_template('styles.css.jinja2', os.path.join(project_dir, 'renderer', 'styles.css'), template_vars)
+        self._render_template('index.html.jinja2', os.path.join(project_dir, 'renderer', 'index.html'), template_vars, lock)
+        self._render_template('index.js.jinja2', os.path.join(project_dir, 'renderer', 'index.js'), template_vars, lock)
+        self._render_template('styles.css.jinja2', os.path.join(project_dir, 'renderer', 'styles.css'), template_vars, lock)
         
         # Python文件
-        self._render_template('main.py.jinja2', os.path.join(project_dir, 'python', 'main.py'), template_vars)
-        self._render_template('requirements.txt.jinja2', os.path.join(project_dir, 'python', 'requirements.txt'), template_vars)
-        self._render_template('main.spec.jinja2', os.path.join(project_dir, 'python', 'main.spec'), template_vars)
+        self._render_template('main.py.jinja2', os.path.join(project_dir, 'python', 'main.py'), template_vars, lock)
+        self._render_template('requirements.txt.jinja2', os.path.join(project_dir, 'python', 'requirements.txt'), template_vars, lock)
+        self._render_template('main.spec.jinja2', os.path.join(project_dir, 'python', 'main.spec'), template_vars, lock)
     
-    def _render_template(self, template_name, output_path, template_vars):
+    def _render_template(self, template_name, output_path, template_vars, lock=None):
         """渲染单个模板文件"""
         template = self.env.get_template(template_name)
         rendered_content = template.render(**template_vars)
         
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write(rendered_content)
+        
+        if lock is not None:
+            lock.record(f'electron_python/{template_name}', output_path, template_vars, rendered_content)
 
 
 def main():
@@ -114,6 +127,7 @@ def main():
     create_parser.add_argument('--debug-mode', action='store_true', help='启用调试模式')
     create_parser.add_argument('--author-name', help='项目作者姓名')
     create_parser.add_argument('--author-email', help='项目作者邮箱')
+    create_parser.add_argument('--enable-jobs', action='store_true', help='生成后台进程池任务子系统')
     
     # 解析命令行参数
     args = parser.parse_args()
@@ -121,7 +135,7 @@ def main():
     if args.command == 'create':
         app = ElectronPythonApp()
         app.create_project(args.project_name, args.output_dir, args.debug_mode,
-                          args.author_name, args.author_email)
+                          args.author_name, args.author_email, args.enable_jobs)
     else:
         parser.print_help()
 
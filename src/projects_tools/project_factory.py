@@ -12,6 +12,7 @@ from jinja2 import Environment, PackageLoader
 from rich.panel import Panel
 
 from .utils import console, print_section
+from .project_lock import ProjectLock
 
 
 # Initialize Jinja2 environment
@@ -36,6 +37,8 @@ class ProjectComponent(ABC):
         self.project_name = project_name
         self.options = options
         self.python_package_name = project_name.replace('-', '_')
+        # Set by ProjectFactory so rendered templates are recorded in the lock file
+        self.lock: Optional[ProjectLock] = None
     
     @abstractmethod
     def create(self) -> bool:
@@ -74,6 +77,9 @@ class ProjectComponent(ABC):
             with open(output_path, 'w') as f:
                 f.write(content)
             
+            if self.lock is not None:
+                self.lock.record(template_name, output_path, context, content)
+            
             return True
         except Exception as e:
             console.print(f"[error]Error rendering template {template_name}: {str(e)}[/]")
@@ -104,10 +110,16 @@ class ProjectFactory:
         project_path = Path(project_name)
         os.makedirs(project_path, exist_ok=True)
         
+        options = components[0].options if components else {}
+        lock = ProjectLock(project_path, "project", options)
+        
         for component in components:
+            component.lock = lock
             if not component.create():
                 return False
         
+        lock.save()
+        
         console.print(Panel(
             f"[success]✨ 项目 [highlight]{project_name}[/] 创建完成！\n"
             "👉 下一步操作建议:\n"
@@ -0,0 +1,175 @@
+"""
+Project lock file module.
+This module records which template produced each generated file, the render
+context that was used and a content hash, so that `projects update` can later
+re-render templates and rewrite only the files whose output actually changed.
+"""
+import os
+import json
+import hashlib
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Union
+
+from jinja2 import Environment, PackageLoader
+
+from .version import __version__
+
+
+LOCK_FILE_NAME = ".projects.lock.json"
+LOCK_FORMAT_VERSION = 1
+
+# All template names in the lock file are relative to the package templates dir
+env = Environment(
+    loader=PackageLoader('projects_tools', 'templates')
+)
+
+
+def content_hash(content: str) -> str:
+    """Return the sha256 hex digest of rendered text content."""
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def file_hash(path: Union[str, Path]) -> Optional[str]:
+    """Return the content hash of a file on disk, or None if it does not exist."""
+    try:
+        with open(path, 'r', encoding='utf-8', errors='surrogateescape') as f:
+            return hashlib.sha256(f.read().encode('utf-8', errors='surrogateescape')).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+class ProjectLock:
+    """Records generated files and the inputs they were rendered from."""
+
+    def __init__(self, project_path: Union[str, Path], generator: str,
+                 options: Optional[Dict[str, Any]] = None):
+        """
+        Initialize an empty lock.
+
+        Args:
+            project_path: Path to the project directory
+            generator: Name of the generator that created the project
+            options: Project level options used for creation
+        """
+        self.project_path = Path(project_path)
+        self.generator = generator
+        self.options = dict(options or {})
+        self.template_version = __version__
+        self.files: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def lock_path(self) -> Path:
+        return self.project_path / LOCK_FILE_NAME
+
+    def record(self, template_name: str, output_path: Union[str, Path],
+               context: Dict[str, Any], content: str) -> None:
+        """
+        Record a rendered template output.
+
+        Args:
+            template_name: Template name relative to the templates directory
+            output_path: Path the content was written to
+            context: Context data used for rendering
+            content: The rendered content
+        """
+        rel_path = Path(os.path.relpath(output_path, self.project_path)).as_posix()
+        self.files[rel_path] = {
+            'template': template_name,
+            'context': dict(context),
+            'hash': content_hash(content),
+        }
+
+    def save(self) -> None:
+        """Write the lock file into the project directory."""
+        data = {
+            'lock_version': LOCK_FORMAT_VERSION,
+            'generator': self.generator,
+            'template_version': self.template_version,
+            'options': self.options,
+            'files': {key: self.files[key] for key in sorted(self.files)},
+        }
+        with open(self.lock_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.write('\n')
+
+    @classmethod
+    def load(cls, project_path: Union[str, Path]) -> 'ProjectLock':
+        """
+        Load the lock file of an existing project.
+
+        Raises:
+            FileNotFoundError: If the project has no lock file
+        """
+        project_path = Path(project_path)
+        with open(project_path / LOCK_FILE_NAME, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        lock = cls(project_path, data.get('generator', 'project'), data.get('options'))
+        lock.template_version = data.get('template_version')
+        lock.files = data.get('files', {})
+        return lock
+
+
+class UpdateResult:
+    """Outcome of an update run, grouped by file state."""
+
+    def __init__(self):
+        self.updated: List[str] = []
+        self.unchanged: List[str] = []
+        self.modified: List[str] = []
+        self.missing: List[str] = []
+        self.failed: Dict[str, str] = {}
+
+
+def update_project(project_path: Union[str, Path], dry_run: bool = False,
+                   force: bool = False) -> UpdateResult:
+    """
+    Re-render the templates recorded in a project's lock file.
+
+    Only files whose rendered output changed are rewritten, so untouched
+    files keep their mtimes. Files edited by the user since they were
+    generated are left alone unless `force` is set.
+
+    Args:
+        project_path: Path to the project directory
+        dry_run: Report what would change without writing anything
+        force: Overwrite files even if they were edited by the user
+
+    Returns:
+        UpdateResult: The files grouped by what happened to them
+    """
+    lock = ProjectLock.load(project_path)
+    result = UpdateResult()
+
+    for rel_path, entry in sorted(lock.files.items()):
+        try:
+            content = env.get_template(entry['template']).render(**entry['context'])
+        except Exception as e:
+            result.failed[rel_path] = str(e)
+            continue
+
+        new_hash = content_hash(content)
+        if new_hash == entry['hash']:
+            result.unchanged.append(rel_path)
+            continue
+
+        output_path = lock.project_path / rel_path
+        current_hash = file_hash(output_path)
+        if current_hash is None and not force:
+            result.missing.append(rel_path)
+            continue
+        if current_hash != entry['hash'] and not force:
+            result.modified.append(rel_path)
+            continue
+
+        if not dry_run:
+            os.makedirs(output_path.parent, exist_ok=True)
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            entry['hash'] = new_hash
+        result.updated.append(rel_path)
+
+    if not dry_run and (result.updated or lock.template_version != __version__):
+        lock.template_version = __version__
+        lock.save()
+
+    return result
@@ -0,0 +1,221 @@
+"""
+Cached release pipeline.
+This module backs `projects release`, which replaces the serial deploy.sh:
+the frontend build runs concurrently with fingerprinting the Python sources,
+the wheel is only rebuilt when its inputs changed, installation uses a
+no-deps fast path, and tagging/uploading stays behind MODE=release.
+"""
+import os
+import sys
+import json
+import glob
+import shutil
+import subprocess
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Union
+
+from .utils import console, print_section, print_command
+from .static_builder import StaticBuilder, CACHE_FILE_NAME, hash_file, hash_tree, combine_hashes
+
+
+# Files at the project root that are part of the wheel's inputs
+PROJECT_INPUT_FILES = ("setup.py", "setup.cfg", "pyproject.toml", "MANIFEST.in",
+                       "requirements.txt", "README.md")
+
+EXCLUDED_PACKAGE_DIRS = {"web", "__pycache__"}
+
+
+def read_version(version_path: Union[str, Path]) -> str:
+    """Read __version__ from a version.py file the same way setup.py does."""
+    scope: Dict[str, Any] = {}
+    with open(version_path) as f:
+        exec(f.read(), scope)
+    return scope["__version__"]
+
+
+def find_package(project_path: Union[str, Path]) -> Optional[str]:
+    """Return the only package under src/ that has a version.py."""
+    candidates = [
+        path.parent.name
+        for path in sorted(Path(project_path, "src").glob("*/version.py"))
+    ]
+    return candidates[0] if len(candidates) == 1 else None
+
+
+class ReleasePipeline:
+    """Builds, installs and optionally publishes a generated project."""
+
+    def __init__(self, project_path: Union[str, Path], package_name: str,
+                 frontend_dir: Optional[Union[str, Path]] = "frontend",
+                 mode: str = "release", force: bool = False, editable: bool = False):
+        """
+        Initialize the pipeline.
+
+        Args:
+            project_path: Path to the project directory
+            package_name: Python package name under src/
+            frontend_dir: Frontend directory relative to the project, None to skip it
+            mode: "release" to tag and upload after installing, anything else to stop there
+            force: Ignore all caches
+            editable: Install the project in editable mode instead of installing the wheel
+        """
+        self.project_path = Path(project_path)
+        self.package_name = package_name
+        self.package_dir = self.project_path / "src" / package_name
+        self.frontend_dir = self.project_path / frontend_dir if frontend_dir else None
+        self.web_dir = self.package_dir / "web"
+        self.dist_dir = self.project_path / "dist"
+        self.mode = mode
+        self.force = force
+        self.editable = editable
+        self.cache_path = self.project_path / CACHE_FILE_NAME
+        self.cache = self._load_cache()
+
+    def _load_cache(self) -> Dict[str, Any]:
+        if self.force or not self.cache_path.exists():
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_cache(self) -> None:
+        with open(self.cache_path, 'w', encoding='utf-8') as f:
+            json.dump(self.cache, f, indent=2)
+            f.write('\n')
+
+    def _run(self, *args: str) -> bool:
+        print_command(" ".join(args))
+        return_code = subprocess.call(list(args), cwd=self.project_path)
+        if return_code != 0:
+            console.print(f"[error]✘ {' '.join(args)} 失败，退出码: {return_code}[/]")
+            return False
+        return True
+
+    @property
+    def is_release(self) -> bool:
+        return self.mode == "release"
+
+    def build_frontend(self) -> bool:
+        """Build the frontend and sync it into the package, if there is one."""
+        if self.frontend_dir is None or not self.frontend_dir.is_dir():
+            return True
+        return StaticBuilder(self.frontend_dir, self.web_dir, force=self.force).run()
+
+    def source_hashes(self) -> Dict[str, str]:
+        """Hash the Python sources and project metadata, excluding web/."""
+        hashes = {
+            f"src/{self.package_name}/{rel_path}": digest
+            for rel_path, digest in hash_tree(self.package_dir, EXCLUDED_PACKAGE_DIRS).items()
+            if not rel_path.endswith((".pyc", ".pyo"))
+        }
+        for name in PROJECT_INPUT_FILES:
+            path = self.project_path / name
+            if path.exists():
+                hashes[name] = hash_file(path)
+        return hashes
+
+    def wheel_key(self, source_hashes: Dict[str, str]) -> str:
+        """Combine the source hashes with the web/ manifest into the wheel cache key."""
+        web_hashes = {f"web/{k}": v for k, v in hash_tree(self.web_dir).items()}
+        return combine_hashes({**source_hashes, **web_hashes, "mode": self.mode})
+
+    def build_wheel(self, key: str) -> Optional[List[str]]:
+        """
+        Build the distributions unless a wheel for the same inputs is in dist/.
+
+        Returns:
+            Optional[List[str]]: The artifact paths, or None if the build failed
+        """
+        artifacts = self.cache.get("artifacts", [])
+        if (self.cache.get("wheel_key") == key and artifacts
+                and all((self.project_path / a).exists() for a in artifacts)):
+            console.print("[info]输入未变化，跳过 wheel 构建[/]")
+            return artifacts
+
+        if self.dist_dir.exists():
+            shutil.rmtree(self.dist_dir)
+        targets = ["sdist", "bdist_wheel"] if self.is_release else ["bdist_wheel"]
+        if not self._run(sys.executable, "setup.py", "-q", *targets):
+            return None
+
+        artifacts = sorted(
+            os.path.relpath(path, self.project_path)
+            for path in glob.glob(str(self.dist_dir / "*"))
+        )
+        self.cache["wheel_key"] = key
+        self.cache["artifacts"] = artifacts
+        self.cache.pop("installed_key", None)
+        self._save_cache()
+        return artifacts
+
+    def install(self, key: str, artifacts: List[str], version: str) -> bool:
+        """Install the wheel (or the source tree if editable) without resolving dependencies."""
+        wheels = [a for a in artifacts if a.endswith(".whl")]
+        if not wheels and not self.editable:
+            console.print("[error]✘ dist/ 中没有找到 wheel 文件[/]")
+            return False
+
+        installed_key = f"editable:{key}" if self.editable else key
+        if self.cache.get("installed_key") == installed_key and self.installed_version() == version:
+            console.print("[info]相同的版本已安装，跳过安装[/]")
+            return True
+
+        target = ["-e", "."] if self.editable else ["--force-reinstall", wheels[0]]
+        if not self._run(sys.executable, "-m", "pip", "install", "--no-deps", "-q", *target):
+            return False
+        self.cache["installed_key"] = installed_key
+        self._save_cache()
+        return True
+
+    def installed_version(self) -> Optional[str]:
+        try:
+            from importlib.metadata import version, PackageNotFoundError
+        except ImportError:
+            return None
+        try:
+            return version(self.package_name)
+        except PackageNotFoundError:
+            return None
+
+    def publish(self, version: str, artifacts: List[str]) -> bool:
+        """Tag the release and upload the distributions."""
+        if not self._run("git", "tag", f"v{version}"):
+            return False
+        if not self._run("git", "push", "origin", f"v{version}"):
+            return False
+        console.print(f"[info]Upload {self.package_name} {version}[/]")
+        return self._run("twine", "upload", *artifacts)
+
+    def run(self) -> bool:
+        """
+        Run the whole pipeline.
+
+        Returns:
+            bool: True if every step succeeded, False otherwise
+        """
+        version = read_version(self.package_dir / "version.py")
+        print_section(f"发布 {self.package_name} {version}")
+
+        # The wheel embeds web/, so only the source fingerprint can overlap with the frontend build
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            frontend = executor.submit(self.build_frontend)
+            sources = executor.submit(self.source_hashes)
+            if not frontend.result():
+                return False
+            source_hashes = sources.result()
+
+        key = self.wheel_key(source_hashes)
+        artifacts = self.build_wheel(key)
+        if artifacts is None:
+            return False
+        if not self.install(key, artifacts, version):
+            return False
+
+        if self.is_release and not self.publish(version, artifacts):
+            return False
+
+        console.print(f"[success]✅ {self.package_name} {version} 已完成 ({self.mode})[/]")
+        return True
@@ -0,0 +1,226 @@
+"""
+Incremental static asset builder.
+This module backs `projects build-static`: it skips `npm install` and
+`npm run build` when their inputs are unchanged and syncs the frontend build
+output into the Python package's web directory by content hash, so unchanged
+assets are never rewritten.
+"""
+import os
+import json
+import shutil
+import hashlib
+import subprocess
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Union
+
+from .utils import console, print_section, print_command
+
+
+CACHE_FILE_NAME = ".projects-build.json"
+
+# Directories under the frontend that are not build inputs
+EXCLUDED_SOURCE_DIRS = {"node_modules", "dist", "build", ".git", ".cache", ".vite"}
+
+# Files whose content decides whether `npm install` has to run again
+DEPENDENCY_FILES = ("package.json", "package-lock.json", "npm-shrinkwrap.json")
+
+# Output directories produced by `npm run build`, in order of preference
+OUTPUT_DIRS = ("build", "dist")
+
+
+def hash_file(path: Union[str, Path]) -> str:
+    """Return the sha256 hex digest of a file's content."""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def hash_tree(root: Union[str, Path], excluded_dirs=frozenset()) -> Dict[str, str]:
+    """
+    Hash every file under a directory.
+
+    Args:
+        root: Directory to walk
+        excluded_dirs: Directory names to skip at any depth
+
+    Returns:
+        Dict[str, str]: Relative posix path -> content hash
+    """
+    root = Path(root)
+    hashes = {}
+    if not root.is_dir():
+        return hashes
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in excluded_dirs)
+        for filename in sorted(filenames):
+            path = Path(dirpath) / filename
+            rel_path = path.relative_to(root).as_posix()
+            if rel_path == CACHE_FILE_NAME:
+                continue
+            hashes[rel_path] = hash_file(path)
+    return hashes
+
+
+def combine_hashes(hashes: Dict[str, str]) -> str:
+    """Combine a path -> hash mapping into a single digest."""
+    h = hashlib.sha256()
+    for rel_path in sorted(hashes):
+        h.update(rel_path.encode('utf-8'))
+        h.update(b'\0')
+        h.update(hashes[rel_path].encode('ascii'))
+        h.update(b'\n')
+    return h.hexdigest()
+
+
+def sync_tree(source: Union[str, Path], target: Union[str, Path]) -> Dict[str, List[str]]:
+    """
+    Make `target` an exact copy of `source`, touching only files that differ.
+
+    Args:
+        source: Directory holding the fresh build output
+        target: Directory to update in place
+
+    Returns:
+        Dict[str, List[str]]: Relative paths grouped into added, updated, removed
+    """
+    source, target = Path(source), Path(target)
+    source_hashes = hash_tree(source)
+    target_hashes = hash_tree(target)
+    changes = {"added": [], "updated": [], "removed": []}
+
+    for rel_path, digest in source_hashes.items():
+        if target_hashes.get(rel_path) == digest:
+            continue
+        changes["updated" if rel_path in target_hashes else "added"].append(rel_path)
+        destination = target / rel_path
+        os.makedirs(destination.parent, exist_ok=True)
+        shutil.copy2(source / rel_path, destination)
+
+    for rel_path in target_hashes:
+        if rel_path not in source_hashes:
+            (target / rel_path).unlink()
+            changes["removed"].append(rel_path)
+
+    # Drop directories left empty by removed files
+    for dirpath, dirnames, filenames in os.walk(target, topdown=False):
+        if Path(dirpath) != target and not os.listdir(dirpath):
+            os.rmdir(dirpath)
+
+    return changes
+
+
+class StaticBuilder:
+    """Builds the frontend and syncs its output into the package web dir."""
+
+    def __init__(self, frontend_dir: Union[str, Path], web_dir: Union[str, Path],
+                 force: bool = False):
+        """
+        Initialize the builder.
+
+        Args:
+            frontend_dir: Path to the npm frontend project
+            web_dir: Path to the package directory that serves the static files
+            force: Ignore the cache and always run npm install and npm run build
+        """
+        self.frontend_dir = Path(frontend_dir)
+        self.web_dir = Path(web_dir)
+        self.force = force
+        self.cache_path = self.frontend_dir / CACHE_FILE_NAME
+        self.cache = self._load_cache()
+
+    def _load_cache(self) -> Dict[str, Any]:
+        if self.force or not self.cache_path.exists():
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_cache(self) -> None:
+        with open(self.cache_path, 'w', encoding='utf-8') as f:
+            json.dump(self.cache, f, indent=2)
+            f.write('\n')
+
+    def _run(self, *args: str) -> bool:
+        print_command(" ".join(args))
+        return_code = subprocess.call(list(args), cwd=self.frontend_dir)
+        if return_code != 0:
+            console.print(f"[error]✘ {' '.join(args)} 失败，退出码: {return_code}[/]")
+            return False
+        return True
+
+    def lockfile_hash(self) -> str:
+        """Hash of the dependency manifests that decide whether npm install is needed."""
+        # package.json is always included, a dependency added without updating the lockfile still counts
+        return combine_hashes({
+            name: hash_file(self.frontend_dir / name)
+            for name in DEPENDENCY_FILES
+            if (self.frontend_dir / name).exists()
+        })
+
+    def source_hash(self) -> str:
+        """Hash of all build inputs under the frontend dir."""
+        return combine_hashes(hash_tree(self.frontend_dir, EXCLUDED_SOURCE_DIRS))
+
+    def output_dir(self) -> Optional[Path]:
+        for name in OUTPUT_DIRS:
+            path = self.frontend_dir / name
+            if path.is_dir():
+                return path
+        return None
+
+    def install(self) -> bool:
+        """Run npm install unless the dependency manifests are unchanged since the last install."""
+        lockfile_hash = self.lockfile_hash()
+        if (self.cache.get("lockfile_hash") == lockfile_hash
+                and (self.frontend_dir / "node_modules").is_dir()):
+            console.print("[info]依赖未变化，跳过 npm install[/]")
+            return True
+        if not self._run("npm", "install"):
+            return False
+        self.cache["lockfile_hash"] = self.lockfile_hash()
+        self._save_cache()
+        return True
+
+    def build(self) -> bool:
+        """Run npm run build unless the sources are unchanged since the last build."""
+        source_hash = self.source_hash()
+        if self.cache.get("source_hash") == source_hash and self.output_dir() is not None:
+            console.print("[info]源码未变化，跳过 npm run build[/]")
+            return True
+        if not self._run("npm", "run", "build"):
+            return False
+        self.cache["source_hash"] = source_hash
+        self._save_cache()
+        return True
+
+    def run(self) -> bool:
+        """
+        Install, build and sync the static assets.
+
+        Returns:
+            bool: True if the web dir is up to date, False otherwise
+        """
+        print_section("构建静态资源")
+        if not self.frontend_dir.is_dir():
+            console.print(f"[error]✘ 前端目录不存在: {self.frontend_dir}[/]")
+            return False
+
+        if not self.install() or not self.build():
+            return False
+
+        output_dir = self.output_dir()
+        if output_dir is None:
+            console.print(f"[error]✘ 未找到构建输出目录 ({' / '.join(OUTPUT_DIRS)})[/]")
+            return False
+
+        os.makedirs(self.web_dir, exist_ok=True)
+        changes = sync_tree(output_dir, self.web_dir)
+        console.print(
+            f"[success]✅ 同步到 {self.web_dir}: 新增 {len(changes['added'])} 个，"
+            f"更新 {len(changes['updated'])} 个，删除 {len(changes['removed'])} 个[/]"
+        )
+        return True